@@ -6,22 +6,73 @@ import subprocess
 import asyncio
 import aiohttp
 import re
+import json
+import time
+import pickle
+import types
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from packaging import version
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Use libyaml's C implementation when available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Use orjson for API responses when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Load configuration from YAML file
 with open("config.yaml", "r") as config_file:
-    config = yaml.safe_load(config_file)
+    config = yaml.load(config_file, Loader=Loader)
+
+# Defaults for optional settings
+CONFIG_DEFAULTS = {
+    "check_interval_days": 0,  # Always check
+    "release_cache_ttl_hours": 6,  # Set to 0 to disable caching
+    "telegram_bot_token": None,
+    "telegram_chat_id": None,
+}
+
+# Convert once so settings are plain attribute lookups
+CFG = types.SimpleNamespace(**{**CONFIG_DEFAULTS, **config})
+del config
 
 # Constants from YAML
-APORTS_REPO_URL = config["aports_repo_url"]
-APORTS_DIR = config["aports_dir"]
-MAINTAINER = config["maintainer"]
-RELEASE_MONITORING_API_URL = config["release_monitoring_api_url"]
-API_KEY = config["api_key"]
-DISTRIBUTION = config["distribution"]
-VERSION_HISTORY_FILE = "version_history.yaml"
-CHECK_INTERVAL_DAYS = config.get("check_interval_days", 0)  # Default to 0 (always check)
+APORTS_REPO_URL = CFG.aports_repo_url
+APORTS_DIR = CFG.aports_dir
+MAINTAINER = CFG.maintainer
+RELEASE_MONITORING_API_URL = CFG.release_monitoring_api_url
+API_KEY = CFG.api_key
+DISTRIBUTION = CFG.distribution
+VERSION_HISTORY_FILE = "version_history.json"
+LEGACY_VERSION_HISTORY_FILE = "version_history.yaml"
+APKBUILD_CACHE_FILE = "apkbuild_cache.pkl"
+RELEASE_CACHE_FILE = "release_cache.json"
+CHECK_INTERVAL_DAYS = CFG.check_interval_days
+RELEASE_CACHE_TTL_HOURS = CFG.release_cache_ttl_hours
+MAX_CONCURRENT_REQUESTS = 20  # Simultaneous requests to release-monitoring.org
+MAX_RETRIES = 3  # Attempts per request on HTTP 429/5xx or connection errors
+
+# Use multiple search patterns for better compatibility with busybox
+SEARCH_PATTERNS = [
+    MAINTAINER,  # Full maintainer string
+    MAINTAINER.split("<")[0].strip() if "<" in MAINTAINER else "",  # Just the name
+    MAINTAINER.split("<")[1].split(">")[0] if "<" in MAINTAINER and ">" in MAINTAINER else ""  # Just the email
+]
+SEARCH_PATTERNS = [p for p in SEARCH_PATTERNS if p]  # Remove empty patterns
+
+# Patterns are matched case-insensitively against the decoded maintainer line
+SEARCH_PATTERNS_LOWER = [p.lower() for p in SEARCH_PATTERNS]
+MAINTAINER_PREFIX = b"# Maintainer:"
+
+# Precompiled bytes regex, so APKBUILD fields can be extracted without decoding the file
+FIELDS_RE = re.compile(rb'^(pkgname|pkgver|_pkgreal|_pkgname)=(.+)$', re.MULTILINE)
+APKBUILD_HEADER_SIZE = 4096  # Bytes read from each APKBUILD before falling back to the whole file
+FIELDS_COUNT = 4  # Number of distinct fields matched by FIELDS_RE
 
 
 def update_aports_repo():
@@ -29,146 +80,413 @@ def update_aports_repo():
     if not os.path.exists(APORTS_DIR):
         print(f"Cloning {APORTS_REPO_URL}...")
         subprocess.run(["git", "clone", "--depth=1", APORTS_REPO_URL, APORTS_DIR])
-    else:
-        print(f"Updating {APORTS_DIR}...")
-        subprocess.run(["git", "-C", APORTS_DIR, "pull", "--rebase"])
+        return
+
+    print(f"Updating {APORTS_DIR}...")
+    try:
+        local = subprocess.check_output(["git", "-C", APORTS_DIR, "rev-parse", "HEAD"]).strip()
+        subprocess.run(["git", "-C", APORTS_DIR, "fetch", "--depth=1", "origin"], check=True)
+        remote = subprocess.check_output(["git", "-C", APORTS_DIR, "rev-parse", "FETCH_HEAD"]).strip()
+
+        # Skip the reset if the remote hasn't advanced. Which APKBUILDs need
+        # rescanning is decided against the commit stored with the cache.
+        if local == remote:
+            print(f"{APORTS_DIR} is already up to date.")
+            return
+
+        # A hard reset avoids the rebase graph walk on the shallow clone
+        subprocess.run(["git", "-C", APORTS_DIR, "reset", "--hard", "FETCH_HEAD"], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error updating {APORTS_DIR}: {e}")
+
+
+def get_aports_commit():
+    """Return the commit currently checked out in APORTS_DIR, or None if it can't be determined."""
+    try:
+        return subprocess.check_output(
+            ["git", "-C", APORTS_DIR, "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
 
 
-def extract_package_info(apkbuild_path):
-    """Extract package name, version, and alternative names from APKBUILD."""
-    with open(apkbuild_path, "r", encoding="utf-8", errors="replace") as f:
-        content = f.read()
+def get_changed_files(commit):
+    """Return the files changed in APORTS_DIR since commit, including uncommitted edits.
 
-        # Extract pkgname
-        pkgname_match = re.search(r'^pkgname=(.+)$', content, re.MULTILINE)
-        pkgname = pkgname_match.group(1).strip('"\'').strip() if pkgname_match else None
+    Paths are relative to the repository root. Returns None if commit is
+    unknown or the diff fails (e.g. the commit is no longer in the shallow clone).
+    """
+    if not commit:
+        return None
+
+    try:
+        changed = subprocess.check_output(
+            ["git", "-C", APORTS_DIR, "diff", "--name-only", "--no-renames", commit],
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return changed.decode("utf-8", errors="replace").splitlines()
 
-        # Extract pkgver
-        pkgver_match = re.search(r'^pkgver=(.+)$', content, re.MULTILINE)
-        pkgver = pkgver_match.group(1).strip('"\'').strip() if pkgver_match else None
 
-        # Extract _pkgreal (for Perl packages)
-        pkgreal_match = re.search(r'^_pkgreal=(.+)$', content, re.MULTILINE)
-        pkgreal = pkgreal_match.group(1).strip('"\'').strip() if pkgreal_match else None
+def _field_value(value):
+    """Decode and unquote a raw APKBUILD field value."""
+    return value.decode("utf-8", errors="replace").strip('"\'').strip() if value is not None else None
 
-        # Extract _pkgname (for Python packages)
-        pkgname_python_match = re.search(r'^_pkgname=(.+)$', content, re.MULTILINE)
-        pkgname_python = pkgname_python_match.group(1).strip('"\'').strip() if pkgname_python_match else None
 
-        return {
-            "pkgname": pkgname,
-            "pkgver": pkgver,
-            "pkgreal": pkgreal,
-            "pkgname_python": pkgname_python,
-        }
+def extract_package_info(content):
+    """Extract package name, version, and alternative names from APKBUILD content (bytes)."""
+    fields = {}
+    for match in FIELDS_RE.finditer(content):
+        # Keep the first assignment of each field, like re.search would
+        fields.setdefault(match.group(1), match.group(2))
+        if len(fields) == FIELDS_COUNT:
+            break  # All fields found, skip the rest of the file
+
+    return {
+        "pkgname": _field_value(fields.get(b"pkgname")),
+        "pkgver": _field_value(fields.get(b"pkgver")),
+        "pkgreal": _field_value(fields.get(b"_pkgreal")),  # For Perl packages
+        "pkgname_python": _field_value(fields.get(b"_pkgname")),  # For Python packages
+    }
+
 
+def maintainer_matches(content):
+    """Check whether a maintainer line in APKBUILD content (bytes) matches the search patterns."""
+    # Locate candidate lines with a plain bytes search and only decode those lines
+    start = content.find(MAINTAINER_PREFIX)
+    while start >= 0:
+        end = content.find(b"\n", start)
+        if end < 0:
+            end = len(content)
 
-def find_maintainer_packages_file_traversal():
-    """Get all packages maintained by the specified maintainer by traversing files directly."""
+        # The prefix must start the line
+        if start == 0 or content[start - 1] == ord("\n"):
+            # str.lower() folds non-ASCII case too (e.g. "Ö" and "ö"), unlike bytes.lower()
+            line = content[start:end].decode("utf-8", errors="replace").lower()
+            if any(pattern in line for pattern in SEARCH_PATTERNS_LOWER):
+                return True
+
+        start = content.find(MAINTAINER_PREFIX, end)
+    return False
+
+
+def _iter_apkbuilds(root, errors):
+    """Yield (path, mtime, size) for every APKBUILD below root, using os.scandir directly.
+
+    Directories that can't be scanned are appended to ``errors``.
+    """
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name == "APKBUILD":
+                        st = entry.stat()
+                        yield entry.path, st.st_mtime, st.st_size
+        except OSError as e:
+            print(f"Error scanning directory {directory}: {e}")
+            errors.append(directory)
+
+
+def _scan_apkbuild(apkbuild_path, mtime, size):
+    """Read an APKBUILD and return its (mtime, size, package_info) cache entry."""
+    package_info = None
+    with open(apkbuild_path, "rb") as f:
+        # The maintainer and metadata lines live in the header, so only read that
+        content = f.read(APKBUILD_HEADER_SIZE)
+        header = content
+        truncated = len(content) == APKBUILD_HEADER_SIZE
+        if truncated:
+            header = content[:content.rfind(b"\n") + 1]  # Drop a possibly truncated last line
+
+        # Only extract package info if the maintainer line matches
+        if maintainer_matches(header):
+            package_info = extract_package_info(header)
+
+            # Fall back to the whole file if a required field is further down
+            if not (package_info["pkgname"] and package_info["pkgver"]) and truncated:
+                package_info = extract_package_info(content + f.read())
+
+    return (mtime, size, package_info)
+
+
+def _scan_changed(changed, cached_entries):
+    """Update cached_entries for the changed APKBUILDs (paths relative to APORTS_DIR).
+
+    Returns (entries, complete), where complete is False if any APKBUILD
+    could not be read.
+    """
+    entries = dict(cached_entries)
+    complete = True
+
+    for path in changed:
+        apkbuild_path = os.path.join(APORTS_DIR, path)
+        try:
+            st = os.stat(apkbuild_path)
+        except FileNotFoundError:
+            entries.pop(apkbuild_path, None)  # Package was removed
+            continue
+
+        try:
+            entries[apkbuild_path] = _scan_apkbuild(apkbuild_path, st.st_mtime, st.st_size)
+        except Exception as e:
+            print(f"Error processing file {apkbuild_path}: {e}")
+            entries.pop(apkbuild_path, None)  # Don't keep a stale parse
+            complete = False
+
+    return entries, complete
+
+
+def _scan_subtree(subdir, cached_entries):
+    """Scan one top-level aports directory for APKBUILDs (runs in a worker process).
+
+    Returns (entries, complete): a dict of APKBUILD path -> (mtime, size,
+    package_info), where package_info is None if the maintainer does not
+    match, and False for complete if any file or directory could not be read.
+    """
+    entries = {}
+    errors = []
+
+    for apkbuild_path, mtime, size in _iter_apkbuilds(subdir, errors):
+        try:
+            entry = cached_entries.get(apkbuild_path)
+
+            # Only re-read the APKBUILD if it changed since the last run
+            if entry is None or entry[0] != mtime or entry[1] != size:
+                entry = _scan_apkbuild(apkbuild_path, mtime, size)
+
+            entries[apkbuild_path] = entry
+        except Exception as e:
+            print(f"Error processing file {apkbuild_path}: {e}")
+            errors.append(apkbuild_path)
+
+    return entries, not errors
+
+
+def _walk_aports(cached_entries):
+    """Walk the whole aports tree, one worker process per top-level directory.
+
+    Returns (entries, complete) like _scan_subtree.
+    """
+    try:
+        with os.scandir(APORTS_DIR) as it:
+            subdirs = sorted(entry.path for entry in it
+                             if entry.is_dir(follow_symlinks=False) and entry.name != ".git")
+    except OSError as e:
+        print(f"Error scanning directory {APORTS_DIR}: {e}")
+        return {}, False
+
+    # Only ship each worker the cache entries for its own subtree
+    cached_by_subdir = {subdir: {} for subdir in subdirs}
+    for apkbuild_path, entry in cached_entries.items():
+        subdir = os.path.join(APORTS_DIR, os.path.relpath(apkbuild_path, APORTS_DIR).split(os.sep, 1)[0])
+        if subdir in cached_by_subdir:
+            cached_by_subdir[subdir][apkbuild_path] = entry
+
+    # Walk through the aports directory structure
+    entries = {}
+    complete = True
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_scan_subtree, subdir, cached_by_subdir[subdir]) for subdir in subdirs]
+        for future in futures:
+            subtree_entries, subtree_complete = future.result()
+            entries.update(subtree_entries)
+            complete = complete and subtree_complete
+
+    return entries, complete
+
+
+def find_maintainer_packages_file_traversal(cache):
+    """Get all packages maintained by the specified maintainer by traversing files directly.
+
+    Each top-level aports directory (main, community, testing, ...) is
+    scanned in its own process. APKBUILDs whose (mtime, size) match an
+    entry in ``cache`` are not re-read. The cache is updated in place.
+
+    If the cache records the aports commit it was built from, only the
+    APKBUILDs changed since that commit are re-read and the walk is skipped.
+    """
     print(f"Looking for packages maintained by: {MAINTAINER}")
 
     packages = {}
+    search_patterns = SEARCH_PATTERNS
 
-    # Use multiple search patterns for better compatibility with busybox
-    search_patterns = [
-        MAINTAINER,  # Full maintainer string
-        MAINTAINER.split("<")[0].strip() if "<" in MAINTAINER else "",  # Just the name
-        MAINTAINER.split("<")[1].split(">")[0] if "<" in MAINTAINER and ">" in MAINTAINER else ""  # Just the email
-    ]
+    print(f"Searching for patterns: {search_patterns}")
 
-    search_patterns = [p for p in search_patterns if p]  # Remove empty patterns
+    # Cached parses are only valid for the patterns they were matched against
+    cached_entries = {}
+    if cache.get("patterns") == search_patterns:
+        cached_entries = cache.get("entries", {})
+
+    # Read the commit before scanning, so later changes are picked up next run
+    commit = get_aports_commit()
+    changed = get_changed_files(cache.get("commit")) if cached_entries else None
+
+    if changed is not None:
+        # Also rescan files that had local edits last run, in case they were reverted since
+        changed = sorted(set(changed) | set(cache.get("changed", [])))
+        changed = [path for path in changed if os.path.basename(path) == "APKBUILD"]
+        print(f"Rescanning {len(changed)} changed APKBUILDs...")
+        entries, complete = _scan_changed(changed, cached_entries)
+    else:
+        entries, complete = _walk_aports(cached_entries)
+
+    for package_info in (entry[2] for entry in entries.values()):
+        if package_info and package_info["pkgname"] and package_info["pkgver"]:
+            packages[package_info["pkgname"]] = {
+                "version": package_info["pkgver"],
+                "pkgreal": package_info["pkgreal"],
+                "pkgname_python": package_info["pkgname_python"],
+            }
+            print(f"Found package: {package_info['pkgname']} (version {package_info['pkgver']})")
+
+    # Entries for APKBUILDs that no longer exist are dropped
+    cache["patterns"] = search_patterns
+    cache["entries"] = entries
+    # After a partial scan, force a full walk next run rather than trusting the diff
+    cache["commit"] = commit if complete else None
+    cache["changed"] = get_changed_files(commit) or []
 
-    print(f"Searching for patterns: {search_patterns}")
+    return packages
 
-    # Walk through the aports directory structure
-    for root, dirs, files in os.walk(APORTS_DIR):
-        if "APKBUILD" in files:
-            apkbuild_path = os.path.join(root, "APKBUILD")
 
+def load_apkbuild_cache():
+    """Load cached APKBUILD parses from pickle file."""
+    if os.path.exists(APKBUILD_CACHE_FILE):
+        with open(APKBUILD_CACHE_FILE, "rb") as f:
             try:
-                with open(apkbuild_path, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
-
-                    # Look for maintainer line
-                    for pattern in search_patterns:
-                        maintainer_line = None
-
-                        # Simple case-insensitive search
-                        for line in content.splitlines():
-                            if line.startswith("# Maintainer:") and pattern.lower() in line.lower():
-                                maintainer_line = line
-                                break
-
-                        if maintainer_line:
-                            # Extract package info
-                            package_info = extract_package_info(apkbuild_path)
-                            if package_info["pkgname"] and package_info["pkgver"]:
-                                packages[package_info["pkgname"]] = {
-                                    "version": package_info["pkgver"],
-                                    "pkgreal": package_info["pkgreal"],
-                                    "pkgname_python": package_info["pkgname_python"],
-                                }
-                                print(f"Found package: {package_info['pkgname']} (version {package_info['pkgver']})")
-                            break  # No need to check other patterns
-            except Exception as e:
-                print(f"Error processing file {apkbuild_path}: {e}")
+                return pickle.load(f)
+            except Exception:
+                print(f"Error reading {APKBUILD_CACHE_FILE}, creating new cache")
+                return {}
+    return {}
 
-    return packages
+
+def save_apkbuild_cache(cache):
+    """Save cached APKBUILD parses to pickle file."""
+    with open(APKBUILD_CACHE_FILE, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_version_history():
-    """Load version history from YAML file."""
+    """Load version history from JSON file, migrating the old YAML file if needed."""
+    history = {}
     if os.path.exists(VERSION_HISTORY_FILE):
-        with open(VERSION_HISTORY_FILE, "r") as f:
+        with open(VERSION_HISTORY_FILE, "rb") as f:
             try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError:
+                history = json_loads(f.read()) or {}
+            except ValueError:
                 print(f"Error reading {VERSION_HISTORY_FILE}, creating new history")
-                return {}
-    return {}
+
+    # Written as JSON by the next save_version_history
+    elif os.path.exists(LEGACY_VERSION_HISTORY_FILE):
+        with open(LEGACY_VERSION_HISTORY_FILE, "r") as f:
+            try:
+                print(f"Migrating {LEGACY_VERSION_HISTORY_FILE} to {VERSION_HISTORY_FILE}")
+                history = yaml.load(f, Loader=Loader) or {}
+            except yaml.YAMLError:
+                print(f"Error reading {LEGACY_VERSION_HISTORY_FILE}, creating new history")
+
+    # Convert ISO format timestamps written by older versions to Unix time
+    for entry in history.values():
+        if isinstance(entry.get("last_checked"), str):
+            entry["last_checked"] = datetime.fromisoformat(entry["last_checked"]).timestamp()
+
+    return history
 
 
 def save_version_history(history):
-    """Save version history to YAML file."""
+    """Save version history to JSON file."""
     with open(VERSION_HISTORY_FILE, "w") as f:
-        yaml.dump(history, f, default_flow_style=False)
+        json.dump(history, f)
 
 
-def should_check_package(package, history):
-    """Determine if a package needs to be checked based on history."""
-    if CHECK_INTERVAL_DAYS == 0:  # Always check if interval is 0
-        return True
+def load_release_cache():
+    """Load cached release-monitoring.org lookups from JSON file."""
+    if os.path.exists(RELEASE_CACHE_FILE):
+        with open(RELEASE_CACHE_FILE, "r") as f:
+            try:
+                return json.load(f)
+            except ValueError:
+                print(f"Error reading {RELEASE_CACHE_FILE}, creating new cache")
+                return {}
+    return {}
 
-    if package not in history:
-        return True
 
-    last_check = datetime.fromisoformat(history[package]["last_checked"])
-    return (datetime.now() - last_check) > timedelta(days=CHECK_INTERVAL_DAYS)
+def save_release_cache(cache):
+    """Save cached release-monitoring.org lookups to JSON file, dropping expired entries."""
+    threshold = time.time() - RELEASE_CACHE_TTL_HOURS * 3600
+    cache = {
+        distribution: {name: entry for name, entry in names.items() if entry[0] >= threshold}
+        for distribution, names in cache.items()
+    }
+    with open(RELEASE_CACHE_FILE, "w") as f:
+        json.dump(cache, f)
 
 
-async def get_latest_version_async(package_name, session):
-    """Get the latest version of a package from release-monitoring.org asynchronously."""
+async def get_latest_version_async(package_name, session, cache, semaphore):
+    """Get the latest version of a package from release-monitoring.org asynchronously.
+
+    Lookups are cached per (name, distribution) in ``cache`` for
+    RELEASE_CACHE_TTL_HOURS, including lookups that found no version.
+    At most MAX_CONCURRENT_REQUESTS requests are in flight (bounded by
+    ``semaphore``); HTTP 429/5xx and connection errors are retried with
+    exponential backoff.
+    """
+    distribution_cache = cache.setdefault(DISTRIBUTION, {})
+    cached = distribution_cache.get(package_name)
+    if cached and time.time() - cached[0] < RELEASE_CACHE_TTL_HOURS * 3600:
+        return cached[1]
+
     params = {
         "name": package_name,
         "distribution": DISTRIBUTION,
     }
+    # Passed per request so the shared session can also be used for Telegram
+    headers = {"Authorization": f"Bearer {API_KEY}"}
 
-    try:
-        async with session.get(RELEASE_MONITORING_API_URL, params=params) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["items"]:
-                    project = data["items"][0]
-                    stable_versions = project.get("stable_versions", [])
-                    if stable_versions:
-                        return stable_versions[0]
-    except Exception as e:
-        print(f"Error fetching data for {package_name}: {e}")
+    for attempt in range(MAX_RETRIES):
+        if attempt:
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff before retrying
 
+        retrying = ", retrying" if attempt < MAX_RETRIES - 1 else ""
+        try:
+            async with semaphore:
+                async with session.get(RELEASE_MONITORING_API_URL, params=params, headers=headers) as response:
+                    if response.status == 429 or response.status >= 500:
+                        print(f"Error fetching data for {package_name}: HTTP {response.status}{retrying}")
+                        continue
+
+                    if response.status != 200:
+                        return None
+
+                    data = json_loads(await response.read())
+                    latest_version = None
+                    if data["items"]:
+                        project = data["items"][0]
+                        stable_versions = project.get("stable_versions", [])
+                        if stable_versions:
+                            latest_version = stable_versions[0]
+
+                    # Only successful responses are cached, so errors are retried next run
+                    distribution_cache[package_name] = [time.time(), latest_version]
+                    return latest_version
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching data for {package_name}: {e!r}{retrying}")
+        except Exception as e:
+            print(f"Error fetching data for {package_name}: {e}")
+            return None
+
+    print(f"Giving up on {package_name} after {MAX_RETRIES} attempts")
     return None
 
 
-def send_telegram_message(message, bot_token, chat_id):
+async def send_telegram_message_async(session, message, bot_token, chat_id):
     """Send a message to a Telegram chat using a bot."""
     telegram_api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     payload = {
@@ -178,38 +496,79 @@ def send_telegram_message(message, bot_token, chat_id):
     }
 
     try:
-        import requests  # Import here to avoid dependency issues with async code
-        response = requests.post(telegram_api_url, data=payload)
-        if response.status_code == 200:
-            print(f"Telegram notification sent successfully")
-        else:
-            print(f"Failed to send Telegram notification: {response.status_code}, {response.text}")
+        async with session.post(telegram_api_url, json=payload) as response:
+            if response.status == 200:
+                print(f"Telegram notification sent successfully")
+            else:
+                print(f"Failed to send Telegram notification: {response.status}, {await response.text()}")
     except Exception as e:
         print(f"Error sending Telegram notification: {e}")
 
 
-def notify(message):
-    """Send a notification message to both console and Telegram."""
+async def notify(message, session=None):
+    """Send a notification message to both console and Telegram.
+
+    Reuses ``session`` if given, otherwise opens a short-lived one.
+    """
     print(message)
 
     # Send notification via Telegram bot
-    if config.get("telegram_bot_token") and config.get("telegram_chat_id"):
-        send_telegram_message(
-            message,
-            config["telegram_bot_token"],
-            config["telegram_chat_id"]
-        )
+    if CFG.telegram_bot_token and CFG.telegram_chat_id:
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                await send_telegram_message_async(
+                    session, message, CFG.telegram_bot_token, CFG.telegram_chat_id
+                )
+        else:
+            await send_telegram_message_async(
+                session, message, CFG.telegram_bot_token, CFG.telegram_chat_id
+            )
 
 
-async def check_package_version_async(package, package_info, session, history):
-    """Check a single package version asynchronously."""
-    current_version = package_info["version"]
+def get_alternative_names(package, package_info):
+    """Return the unique names to look up for a package, in order of preference."""
     alternative_names = [package, package_info["pkgreal"], package_info["pkgname_python"]]
-    alternative_names = [name for name in alternative_names if name]  # Remove None values
+    return list(dict.fromkeys(name for name in alternative_names if name))  # Remove None values and duplicates
+
+
+async def get_latest_versions_async(alternative_names, session, release_cache, semaphore):
+    """Look up the latest versions for all packages, querying each unique name only once.
+
+    ``alternative_names`` maps package -> names in order of preference. The
+    next alternative name is only queried for packages still without a version.
+    Returns a dict of name -> latest version (or None).
+    """
+    name_to_version = {}
+    pending = list(alternative_names.values())
+
+    while pending:
+        names = list({remaining[0] for remaining in pending} - name_to_version.keys())
+        results = await asyncio.gather(*[get_latest_version_async(name, session, release_cache, semaphore) for name in names])
+        name_to_version.update(zip(names, results))
+
+        # Fall back to the next alternative name for packages without a match
+        pending = [remaining[1:] for remaining in pending
+                   if not name_to_version[remaining[0]] and len(remaining) > 1]
+
+    return name_to_version
+
+
+@lru_cache(maxsize=None)
+def parse_version(version_string):
+    """Normalize and parse a version string, returning None if it is invalid."""
+    try:
+        return version.parse(version_string.replace("-", "."))
+    except version.InvalidVersion:
+        return None
+
+
+def check_package_version(package, package_info, alternative_names, name_to_version, history):
+    """Check a single package version against the looked up latest versions."""
+    current_version = package_info["version"]
 
     latest_version = None
     for name in alternative_names:
-        latest_version = await get_latest_version_async(name, session)
+        latest_version = name_to_version.get(name)
         if latest_version:
             break  # Stop if we find a match
 
@@ -217,28 +576,23 @@ async def check_package_version_async(package, package_info, session, history):
     if package not in history:
         history[package] = {}
 
-    history[package]["last_checked"] = datetime.now().isoformat()
+    history[package]["last_checked"] = time.time()
     history[package]["current_version"] = current_version
 
     if latest_version:
         history[package]["latest_version"] = latest_version
 
-        # Normalize versions for comparison
-        current_version_normalized = current_version.replace("-", ".")
-        latest_version_normalized = latest_version.replace("-", ".")
+        current_parsed = parse_version(current_version)
+        latest_parsed = parse_version(latest_version)
 
-        try:
-            current_parsed = version.parse(current_version_normalized)
-            latest_parsed = version.parse(latest_version_normalized)
-
-            if latest_parsed > current_parsed:
-                return "upgrade", f"🚀 Upgrade available for {package}: {current_version} -> {latest_version}"
-            elif latest_parsed == current_parsed:
-                return "up-to-date", f"✅ {package} is up to date ({current_version})"
-            else:
-                return "downgrade", f"⚠️ {package}: Current version ({current_version}) is newer than latest ({latest_version})"
-        except version.InvalidVersion:
+        if current_parsed is None or latest_parsed is None:
             return "invalid", f"❌ {package}: Invalid version format (current: {current_version}, latest: {latest_version})"
+        elif latest_parsed > current_parsed:
+            return "upgrade", f"🚀 Upgrade available for {package}: {current_version} -> {latest_version}"
+        elif latest_parsed == current_parsed:
+            return "up-to-date", f"✅ {package} is up to date ({current_version})"
+        else:
+            return "downgrade", f"⚠️ {package}: Current version ({current_version}) is newer than latest ({latest_version})"
     else:
         return "no-version", f"❌ {package}: No version information found in release-monitoring.org"
 
@@ -246,8 +600,11 @@ async def check_package_version_async(package, package_info, session, history):
 async def compare_versions_async(packages):
     """Compare versions using async processing."""
     history = load_version_history()
+    release_cache = load_release_cache()
+    # Skip packages checked within the interval (always check if interval is 0)
+    cutoff = time.time() - CHECK_INTERVAL_DAYS * 86400 if CHECK_INTERVAL_DAYS else float("inf")
     packages_to_check = {pkg: info for pkg, info in packages.items()
-                         if should_check_package(pkg, history)}
+                         if history.get(pkg, {}).get("last_checked", 0) < cutoff}
 
     if not packages_to_check:
         print("No packages need checking at this time.")
@@ -255,12 +612,29 @@ async def compare_versions_async(packages):
 
     print(f"Checking {len(packages_to_check)} packages...")
 
-    async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {API_KEY}"}) as session:
-        tasks = []
-        for package, package_info in packages_to_check.items():
-            tasks.append(check_package_version_async(package, package_info, session, history))
-
-        results = await asyncio.gather(*tasks)
+    alternative_names = {package: get_alternative_names(package, package_info)
+                         for package, package_info in packages_to_check.items()}
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_REQUESTS,
+        limit_per_host=MAX_CONCURRENT_REQUESTS,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,  # Keep TLS connections to release-monitoring.org warm between requests
+    )
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        trust_env=True,  # Honour HTTP(S)_PROXY and friends
+    ) as session:
+        name_to_version = await get_latest_versions_async(alternative_names, session, release_cache, semaphore)
+
+    results = [
+        check_package_version(package, package_info, alternative_names[package], name_to_version, history)
+        for package, package_info in packages_to_check.items()
+    ]
 
     # Categorize results
     categorized_results = {
@@ -298,12 +672,15 @@ async def compare_versions_async(packages):
 
     # Save updated history
     save_version_history(history)
+    save_release_cache(release_cache)
 
 
 async def main():
     """Main function for the package monitor."""
     update_aports_repo()
-    packages = find_maintainer_packages_file_traversal()
+    apkbuild_cache = load_apkbuild_cache()
+    packages = find_maintainer_packages_file_traversal(apkbuild_cache)
+    save_apkbuild_cache(apkbuild_cache)
 
     if packages:
         print(f"Found {len(packages)} packages maintained by {MAINTAINER}")